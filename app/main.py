@@ -1,16 +1,27 @@
 from fastapi import FastAPI, Request, HTTPException
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, Response
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from pydantic import BaseModel
 import uvicorn
+import hashlib
 import os
+from contextlib import asynccontextmanager
 from .password_tool import PasswordTool
 
+# Initialize password tool
+password_tool = PasswordTool()
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    await password_tool.aclose()
+
 # Initialize FastAPI app
-app = FastAPI(title="Password Security Tool")
+app = FastAPI(title="Password Security Tool", lifespan=lifespan)
 
 # Environment-based configuration
 ENVIRONMENT = os.getenv("ENVIRONMENT", "development")
@@ -37,12 +48,33 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress the HTML page and static assets; small API responses are left as-is
+app.add_middleware(GZipMiddleware, minimum_size=500)
+
 # Mount static files and templates
 app.mount("/static", StaticFiles(directory="static"), name="static")
 templates = Jinja2Templates(directory="templates")
 
-# Initialize password tool
-password_tool = PasswordTool()
+# The home page has no per-request content, so it is rendered once at import.
+# The ETag is weak because GZipMiddleware serves it both compressed and not.
+INDEX_HTML = templates.get_template("index.html").render()
+INDEX_ETAG = 'W/"' + hashlib.sha1(INDEX_HTML.encode('utf-8'), usedforsecurity=False).hexdigest() + '"'
+INDEX_CACHE_CONTROL = "public, max-age=300"
+
+def etag_matches(if_none_match, etag: str) -> bool:
+    """Weak comparison of an If-None-Match header against an ETag (RFC 9110 13.1.2)"""
+    if not if_none_match:
+        return False
+    opaque = etag[2:] if etag.startswith("W/") else etag
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*":
+            return True
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == opaque:
+            return True
+    return False
 
 # API models
 class GenerateRequest(BaseModel):
@@ -56,7 +88,10 @@ class CheckRequest(BaseModel):
 # Routes
 @app.get("/", response_class=HTMLResponse)
 async def home(request: Request):
-    return templates.TemplateResponse("index.html", {"request": request})
+    headers = {"ETag": INDEX_ETAG, "Cache-Control": INDEX_CACHE_CONTROL}
+    if etag_matches(request.headers.get("if-none-match"), INDEX_ETAG):
+        return Response(status_code=304, headers=headers)
+    return HTMLResponse(INDEX_HTML, headers=headers)
 
 @app.post("/api/generate")
 async def generate_password(request: GenerateRequest):
@@ -90,7 +125,7 @@ async def check_breach(request: CheckRequest):
         if not request.password:
             raise HTTPException(status_code=400, detail="Password required")
         
-        count = password_tool.check_breach(request.password)
+        count = await password_tool.check_breach(request.password)
         return {"count": count}
     except Exception as e:
         raise HTTPException(status_code=500, detail="Breach check failed")
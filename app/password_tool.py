@@ -1,72 +1,170 @@
+import asyncio
 import hashlib
 import secrets
 import string
-import re
-import requests
+import threading
+import time
+import httpx
+from bisect import bisect_left
+from collections import OrderedDict
 from typing import Optional, Dict, List
 
+SYMBOLS = '!@#$%^&*()_+-=[]{}|;:,.<>?'
+AMBIGUOUS = '0O1lI'
+
+def _build_pool(exclude_ambiguous: bool, include_symbols: bool):
+    """Return the required character sets and the pool sampling tables for a generator configuration"""
+    lowercase = string.ascii_lowercase
+    uppercase = string.ascii_uppercase
+    digits = string.digits
+    
+    # Remove ambiguous characters if requested
+    if exclude_ambiguous:
+        strip_ambiguous = str.maketrans('', '', AMBIGUOUS)
+        lowercase = lowercase.translate(strip_ambiguous)
+        uppercase = uppercase.translate(strip_ambiguous)
+        digits = digits.translate(strip_ambiguous)
+    
+    sets = (lowercase, uppercase, digits)
+    if include_symbols:
+        sets += (SYMBOLS,)
+    return tuple(map(frozenset, sets)), _sampling_tables(''.join(sets))
+
+def _sampling_tables(chars: str):
+    """Build bytes.translate tables mapping random bytes uniformly onto chars
+    
+    Bytes at or above the largest multiple of len(chars) are deleted, so the
+    modulo mapping stays unbiased (rejection sampling).
+    """
+    size = len(chars)
+    cutoff = 256 - 256 % size
+    table = bytes(ord(chars[b % size]) if b < cutoff else 0 for b in range(256))
+    return table, bytes(range(cutoff, 256))
+
+def _random_chars(tables, count: int) -> str:
+    """Draw count characters from a pool using bulk secrets.token_bytes reads"""
+    table, reject = tables
+    chars = b''
+    while len(chars) < count:
+        chars += secrets.token_bytes(2 * (count - len(chars))).translate(table, reject)
+    return chars[:count].decode('ascii')
+
+# Generator pools, precomputed for every (exclude_ambiguous, include_symbols) combination
+_POOLS = {
+    (exclude_ambiguous, include_symbols): _build_pool(exclude_ambiguous, include_symbols)
+    for exclude_ambiguous in (False, True)
+    for include_symbols in (False, True)
+}
+
+# Built once at import and shared by every PasswordTool instance; stored
+# lowercased so lookups only need to lowercase the candidate
+COMMON_PASSWORDS = frozenset(map(str.lower, (
+    'password', '123456', 'password123', 'admin', 'qwerty', 
+    'letmein', 'welcome', 'monkey', '1234567890', 'abc123'
+)))
+
+# Character classes used by the strength checker
+_UPPER = frozenset(string.ascii_uppercase)
+_LOWER = frozenset(string.ascii_lowercase)
+_DIGITS = frozenset(string.digits)
+_SPECIAL = frozenset(SYMBOLS)
+
+# Strength labels: a score up to STRENGTH_THRESHOLDS[i] gets STRENGTH_LABELS[i]
+STRENGTH_THRESHOLDS = (2, 4, 6, 7)
+STRENGTH_LABELS = ("very-weak", "weak", "medium", "strong", "very-strong")
+
+# HaveIBeenPwned range responses cache (keyed by 5-char SHA-1 prefix)
+RANGE_CACHE_SIZE = 4096
+RANGE_CACHE_TTL = 24 * 60 * 60  # seconds
+
+# HaveIBeenPwned HTTP client settings
+HIBP_RANGE_URL = "https://api.pwnedpasswords.com/range/{prefix}"
+HIBP_TIMEOUT = 10  # seconds
+HIBP_USER_AGENT = "password-security-tool"
+HIBP_MAX_KEEPALIVE = 32
+HIBP_RETRIES = 2  # connection attempts retried on connect errors/timeouts
+HIBP_BATCH_CONCURRENCY = 8  # in-flight range requests per check_breach_many call
+
+def _new_client() -> httpx.AsyncClient:
+    """Create the pooled HaveIBeenPwned HTTP client"""
+    return httpx.AsyncClient(
+        timeout=HIBP_TIMEOUT,
+        headers={"User-Agent": HIBP_USER_AGENT},
+        transport=httpx.AsyncHTTPTransport(
+            retries=HIBP_RETRIES,
+            limits=httpx.Limits(max_keepalive_connections=HIBP_MAX_KEEPALIVE),
+        ),
+    )
+
+def _sha1_hex(password: str) -> str:
+    """Uppercase SHA-1 hex digest of a password (lookup key only, not a security primitive here)"""
+    return hashlib.sha1(password.encode('utf-8'), usedforsecurity=False).digest().hex().upper()
+
+def _lookup_count(text: str, suffix: str) -> int:
+    """Find the breach count for a hash suffix in a HaveIBeenPwned range response
+    
+    The response has one "SUFFIX:COUNT" entry per line. A suffix followed by ':'
+    can only match at the start of a line, so a single find locates the entry
+    without splitting the body.
+    """
+    start = text.find(suffix + ':')
+    if start == -1:
+        return 0  # Not found in breaches
+    start += len(suffix) + 1
+    end = text.find('\n', start)
+    return int(text[start:end] if end != -1 else text[start:])
+
 class PasswordTool:
     """Simple password security tool with generation, strength checking, and breach detection"""
     
     def __init__(self):
-        self.common_passwords = {
-            'password', '123456', 'password123', 'admin', 'qwerty', 
-            'letmein', 'welcome', 'monkey', '1234567890', 'abc123'
-        }
+        self.common_passwords = COMMON_PASSWORDS
+        self._common_lengths = frozenset(map(len, self.common_passwords))
+        self._range_cache = OrderedDict()  # prefix -> (expiry, response text)
+        self._range_cache_lock = threading.Lock()
+        # Shared async client: keeps TLS connections to HaveIBeenPwned alive between checks
+        self._client = _new_client()
+    
+    def _get_client(self) -> httpx.AsyncClient:
+        """Return the shared HTTP client, recreating it if a previous shutdown closed it"""
+        if self._client.is_closed:
+            self._client = _new_client()
+        return self._client
+    
+    async def aclose(self):
+        """Close the underlying HTTP client (the next breach check opens a new one)"""
+        await self._client.aclose()
     
     def generate_password(self, length: int = 16, include_symbols: bool = True, exclude_ambiguous: bool = True) -> str:
         """Generate a secure password"""
         if length < 8 or length > 128:
             raise ValueError("Password length must be between 8 and 128 characters")
         
-        # Define character sets
-        lowercase = string.ascii_lowercase
-        uppercase = string.ascii_uppercase
-        digits = string.digits
-        symbols = '!@#$%^&*()_+-=[]{}|;:,.<>?'
-        
-        # Remove ambiguous characters if requested
-        if exclude_ambiguous:
-            ambiguous = '0O1lI'
-            lowercase = ''.join(c for c in lowercase if c not in ambiguous)
-            uppercase = ''.join(c for c in uppercase if c not in ambiguous)
-            digits = ''.join(c for c in digits if c not in ambiguous)
-        
-        # Build character set
-        chars = lowercase + uppercase + digits
-        if include_symbols:
-            chars += symbols
-        
-        # Generate password ensuring at least one character from each required set
-        password = []
-        password.append(secrets.choice(lowercase))
-        password.append(secrets.choice(uppercase))
-        password.append(secrets.choice(digits))
+        required, tables = _POOLS[(exclude_ambiguous, include_symbols)]
         
-        if include_symbols:
-            password.append(secrets.choice(symbols))
-        
-        # Fill remaining length with random characters
-        for _ in range(length - len(password)):
-            password.append(secrets.choice(chars))
-        
-        # Shuffle the password
-        secrets.SystemRandom().shuffle(password)
-        
-        return ''.join(password)
+        # Draw the whole password from the combined pool and retry until every
+        # required set is represented; accepted passwords are uniform over all
+        # valid ones, so no per-set seeding or shuffle is needed
+        while True:
+            password = _random_chars(tables, length)
+            chars = set(password)
+            if not any(chars.isdisjoint(pool) for pool in required):
+                return password
     
     def check_password_strength(self, password: str) -> Dict:
         """Check password strength and return analysis"""
         if not password:
             raise ValueError("Password cannot be empty")
         
-        # Basic checks
+        # Basic checks (set operations run in C, independent of where classes appear)
         length = len(password)
-        has_upper = bool(re.search(r'[A-Z]', password))
-        has_lower = bool(re.search(r'[a-z]', password))
-        has_digits = bool(re.search(r'[0-9]', password))
-        has_special = bool(re.search(r'[!@#$%^&*()_+\-=\[\]{}|;:,.<>?]', password))
-        is_common = password.lower() in self.common_passwords
+        chars = set(password)
+        has_upper = not chars.isdisjoint(_UPPER)
+        has_lower = not chars.isdisjoint(_LOWER)
+        has_digits = not chars.isdisjoint(_DIGITS)
+        has_special = not chars.isdisjoint(_SPECIAL)
+        # Lengths no common entry has skip the lowercase copy and hash lookup
+        is_common = length in self._common_lengths and password.lower() in self.common_passwords
         
         # Calculate strength score
         score = 0
@@ -88,16 +186,7 @@ class PasswordTool:
             score += 1
         
         # Determine strength label
-        if score <= 2:
-            strength_label = "very-weak"
-        elif score <= 4:
-            strength_label = "weak"
-        elif score <= 6:
-            strength_label = "medium"
-        elif score <= 7:
-            strength_label = "strong"
-        else:
-            strength_label = "very-strong"
+        strength_label = STRENGTH_LABELS[bisect_left(STRENGTH_THRESHOLDS, score)]
         
         # Generate recommendations
         recommendations = []
@@ -128,33 +217,85 @@ class PasswordTool:
             "recommendations": recommendations
         }
     
-    def check_breach(self, password: str) -> Optional[int]:
+    async def _fetch_range(self, prefix: str) -> Optional[str]:
+        """Fetch the HaveIBeenPwned range response for a hash prefix, using the cache"""
+        now = time.monotonic()
+        with self._range_cache_lock:
+            entry = self._range_cache.get(prefix)
+            if entry is not None:
+                expiry, text = entry
+                if expiry > now:
+                    self._range_cache.move_to_end(prefix)
+                    return text
+                del self._range_cache[prefix]
+        
+        response = await self._get_client().get(HIBP_RANGE_URL.format(prefix=prefix))
+        if response.status_code != 200:
+            return None  # API error, never cached
+        
+        text = response.text
+        with self._range_cache_lock:
+            self._range_cache[prefix] = (now + RANGE_CACHE_TTL, text)
+            self._range_cache.move_to_end(prefix)
+            while len(self._range_cache) > RANGE_CACHE_SIZE:
+                self._range_cache.popitem(last=False)
+        return text
+    
+    async def check_breach(self, password: str) -> Optional[int]:
         """Check if password has been in a data breach using HaveIBeenPwned API"""
         if not password:
             return None
         
         try:
-            # Hash the password using SHA-1
-            sha1_hash = hashlib.sha1(password.encode('utf-8')).hexdigest().upper()
+            sha1_hash = _sha1_hex(password)
             
             # Send first 5 characters to HaveIBeenPwned API
             prefix = sha1_hash[:5]
             suffix = sha1_hash[5:]
             
-            # Make API request
-            url = f"https://api.pwnedpasswords.com/range/{prefix}"
-            response = requests.get(url, timeout=10)
+            # Fetch range (served from cache when possible)
+            text = await self._fetch_range(prefix)
             
-            if response.status_code == 200:
-                # Parse response to find our suffix
-                hashes = response.text.splitlines()
-                for line in hashes:
-                    hash_suffix, count = line.split(':')
-                    if hash_suffix == suffix:
-                        return int(count)
-                return 0  # Not found in breaches
-            else:
+            if text is None:
                 return None  # API error
+            
+            return _lookup_count(text, suffix)
                 
         except Exception:
             return None  # Network or other error
+    
+    async def check_breach_many(self, passwords: List[str]) -> List[Optional[int]]:
+        """Check several passwords, fetching each distinct hash prefix only once"""
+        # Each password is guarded like check_breach: any failure yields None for that item only
+        hashes = []
+        for password in passwords:
+            try:
+                hashes.append(_sha1_hex(password) if password else None)
+            except Exception:
+                hashes.append(None)
+        prefixes = list({sha1_hash[:5] for sha1_hash in hashes if sha1_hash})
+        
+        # Fetch ranges concurrently (bounded); a failed prefix only affects its own passwords
+        semaphore = asyncio.Semaphore(HIBP_BATCH_CONCURRENCY)
+        
+        async def fetch(prefix):
+            async with semaphore:
+                return await self._fetch_range(prefix)
+        
+        responses = await asyncio.gather(*map(fetch, prefixes), return_exceptions=True)
+        texts = {
+            prefix: None if isinstance(text, Exception) else text
+            for prefix, text in zip(prefixes, responses)
+        }
+        
+        results = []
+        for sha1_hash in hashes:
+            text = texts.get(sha1_hash[:5]) if sha1_hash else None
+            if text is None:
+                results.append(None)
+                continue
+            try:
+                results.append(_lookup_count(text, sha1_hash[5:]))
+            except Exception:
+                results.append(None)  # Malformed range body
+        return results